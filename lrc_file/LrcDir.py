@@ -1,10 +1,14 @@
 import fnmatch
+import logging
 import os
 
 from .LrcFile import LrcFile
 from .LrcFileCollection import LrcFileCollection
 
 
+logger = logging.getLogger(__name__)
+
+
 class LrcDir(LrcFileCollection):
     """
     LrcDir represents a directory that contains files suitable for
@@ -17,12 +21,43 @@ class LrcDir(LrcFileCollection):
         self._dir_name = dir_name
         self._read_dir_data(dir_name)
 
+    def _lrc_file_names(self, dir_name: str) -> list[str]:
+        return [
+            os.path.join(dir_name, fname)
+            for _, _, files in os.walk(dir_name, onerror=self._handle_walk_error)
+            for fname in files
+            if fnmatch.fnmatch(fname, "*.lrc")
+        ]
+
     def _read_dir_data(self, dir_name: str):
-        for _, _, files in os.walk(dir_name, onerror=self._handle_walk_error):
-            for fname in files:
-                if fnmatch.fnmatch(fname, "*.lrc"):
-                    fname_full = os.path.join(dir_name, fname)
-                    self.append_data_file(LrcFile(fname_full))
+        for fname_full in self._lrc_file_names(dir_name):
+            self.append_data_file(LrcFile(fname_full))
+
+    def refresh(self) -> bool:
+        """
+        Loads files added to the directory since the last refresh and drops
+        files that were removed. Files that fail to load (e.g. those still
+        being copied) are logged and skipped, so the next refresh retries
+        them. Returns True if anything changed.
+        """
+        fnames = set(self._lrc_file_names(self._dir_name))
+        loaded = {data_file.filename for data_file in self._data_files}
+
+        new_files = []
+        for fname in sorted(fnames - loaded):
+            try:
+                new_files.append(LrcFile(fname))
+            except Exception:
+                logger.exception(f"Skipping data file '{fname}' that failed to load")
+
+        if not new_files and loaded <= fnames:
+            return False
+
+        # build a new list, so that readers of the old one are not affected
+        self._data_files = [
+            data_file for data_file in self._data_files if data_file.filename in fnames
+        ] + new_files
+        return True
 
     def _handle_walk_error(self, error: OSError):
         raise Exception(
@@ -0,0 +1,222 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator
+import csv
+import itertools
+import json
+
+from .LrcFile import LrcFile
+
+
+METADATA_COLUMNS = ["test_uuid", "recipe_name", "recipe_params", "machines"]
+RAW_SERIES_COLUMNS = [
+    "test_uuid",
+    "data_type",
+    "side",
+    "iteration",
+    "series",
+    "interval",
+    "value",
+]
+
+
+class _CsvWriter:
+    def __init__(self, filename: str, columns: list[str]):
+        self._file = open(filename, "w", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=columns)
+        self._writer.writeheader()
+
+    def write_rows(self, rows: list[dict[str, Any]]):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(
+        self,
+        filename: str,
+        columns: list[str],
+        float_columns: set[str],
+        int_columns: set[str],
+    ):
+        try:
+            import pyarrow  # type: ignore
+            import pyarrow.parquet  # type: ignore
+        except ImportError:
+            raise Exception("Parquet export requires the 'pyarrow' package")
+
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema(
+            [
+                (
+                    column,
+                    pyarrow.float64() if column in float_columns
+                    else pyarrow.int64() if column in int_columns
+                    else pyarrow.string(),
+                )
+                for column in columns
+            ]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(filename, self._schema)
+
+    def write_rows(self, rows: list[dict[str, Any]]):
+        self._writer.write_table(
+            self._pyarrow.Table.from_pylist(rows, schema=self._schema)
+        )
+
+    def close(self):
+        self._writer.close()
+
+
+def _open_writer(
+    filename: str,
+    file_format: str,
+    columns: list[str],
+    float_columns: set[str],
+    int_columns: set[str],
+):
+    if file_format == "csv":
+        return _CsvWriter(filename, columns)
+    elif file_format == "parquet":
+        return _ParquetWriter(filename, columns, float_columns, int_columns)
+    raise Exception(f"Unknown export format '{file_format}'")
+
+
+def _write_chunked(writer, rows: Iterator[dict[str, Any]], chunk_size: int):
+    try:
+        while chunk := list(itertools.islice(rows, chunk_size)):
+            writer.write_rows(chunk)
+    finally:
+        writer.close()
+
+
+def _metadata(data_file: LrcFile) -> dict[str, Any]:
+    return {
+        "test_uuid": data_file.test_uuid,
+        "recipe_name": data_file.recipe_name,
+        "recipe_params": json.dumps(
+            data_file.recipe_params._to_dict(), sort_keys=True, default=str
+        ),
+        "machines": ",".join(sorted(data_file.machines)),
+    }
+
+
+def export_metrics(
+    data_files: Iterable[LrcFile],
+    filename: str,
+    file_format: str = "csv",
+    metrics_type: str = "metrics",
+    chunk_size: int = 1000,
+):
+    """
+    Writes one row per data file with metadata columns and one column per
+    metric of `metrics_type` (name of an LrcFile metrics property, e.g.
+    "metrics" or "evaluation_metrics"). Metrics missing in a file are left
+    empty.
+
+    `file_format` is either "csv" or "parquet" (requires pyarrow), rows are
+    written in chunks of `chunk_size` rows.
+    """
+    data_files = list(data_files)
+    metric_names = sorted(
+        {
+            metric_name
+            for data_file in data_files
+            for metric_name in getattr(data_file, metrics_type)
+        }
+    )
+    writer = _open_writer(
+        filename,
+        file_format,
+        METADATA_COLUMNS + metric_names,
+        float_columns=set(metric_names),
+        int_columns=set(),
+    )
+    rows = (
+        {**_metadata(data_file), **getattr(data_file, metrics_type)}
+        for data_file in data_files
+    )
+    _write_chunked(writer, rows, chunk_size)
+
+
+def _raw_series_rows(data_files: Iterable[LrcFile]) -> Iterator[dict[str, Any]]:
+    for data_file in data_files:
+        test_uuid = data_file.test_uuid
+        for data_type, runs in [
+            ("flow", data_file.get_raw_flow_data()),
+            ("cpu", data_file.get_raw_cpu_data()),
+        ]:
+            for iteration, run in enumerate(runs):
+                for side, run_series in [
+                    ("generator", run.generator_series),
+                    ("receiver", run.receiver_series),
+                ]:
+                    for series in run_series:
+                        for interval, value in enumerate(series.data):
+                            yield {
+                                "test_uuid": test_uuid,
+                                "data_type": data_type,
+                                "side": side,
+                                "iteration": iteration,
+                                "series": series.label,
+                                "interval": interval,
+                                "value": value,
+                            }
+
+
+def export_raw_series(
+    data_files: Iterable[LrcFile],
+    filename: str,
+    file_format: str = "csv",
+    chunk_size: int = 100000,
+):
+    """
+    Writes raw per-interval flow and CPU data of all data files in long
+    format, one row per interval value. Rows are generated lazily and
+    written in chunks of `chunk_size` rows.
+    """
+    writer = _open_writer(
+        filename,
+        file_format,
+        RAW_SERIES_COLUMNS,
+        float_columns={"value"},
+        int_columns={"iteration", "interval"},
+    )
+    _write_chunked(writer, _raw_series_rows(data_files), chunk_size)
+
+
+class ExportMixin(ABC):
+    """
+    Adds export of `data_files` of the class to CSV or Parquet files
+    """
+
+    @property
+    @abstractmethod
+    def data_files(self) -> list[LrcFile]:
+        ...
+
+    def export_metrics(
+        self,
+        filename: str,
+        file_format: str = "csv",
+        metrics_type: str = "metrics",
+        chunk_size: int = 1000,
+    ):
+        """
+        Writes one row per data file with its metadata and metrics,
+        see export_metrics()
+        """
+        export_metrics(self.data_files, filename, file_format, metrics_type, chunk_size)
+
+    def export_raw_series(
+        self,
+        filename: str,
+        file_format: str = "csv",
+        chunk_size: int = 100000,
+    ):
+        """
+        Writes raw per-interval data of all data files in long format,
+        see export_raw_series()
+        """
+        export_raw_series(self.data_files, filename, file_format, chunk_size)
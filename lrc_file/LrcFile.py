@@ -1,35 +1,43 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Sequence, TYPE_CHECKING
 import functools
 import itertools
 
-from lnst.Common import Parameters
-from lnst.Controller.Recipe import RecipeRun, import_recipe_run
-from lnst.Controller.RecipeResults import BaseResult
-from lnst.RecipeCommon.Perf.Results import PerfResult
-from lnst.RecipeCommon.Perf.Measurements.Results.FlowMeasurementResults import FlowMeasurementResults
-from lnst.RecipeCommon.Perf.Measurements.Results.CPUMeasurementResults import CPUMeasurementResults
-from lnst.RecipeCommon.Perf.Evaluators.BaselineEvaluator import BaselineEvaluationResult
+# lnst is imported only when a file is actually loaded or its results are
+# type-checked, importing it is expensive
+if TYPE_CHECKING:
+    from lnst.Common import Parameters
+    from lnst.Controller.Recipe import RecipeRun
+    from lnst.Controller.RecipeResults import BaseResult
+    from lnst.RecipeCommon.Perf.Results import PerfResult
 
 
 @dataclass(frozen=True)
 class Series:
     label: str
-    data: list[float] = field(default_factory=list)
+    data: Sequence[float] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
 class Run:
     label: str
-    generator_series: list[Series] = field(default_factory=list, init=False)
-    receiver_series: list[Series] = field(default_factory=list, init=False)
+    generator_series: Sequence[Series] = field(default_factory=list)
+    receiver_series: Sequence[Series] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
 class _Flow:
+    """Series of a single flow, one for each run"""
     is_aggregated: bool
-    generator_data: list[list[float]] = field(default_factory=list)
-    receiver_data: list[list[float]] = field(default_factory=list)
+    generator_series: tuple[Series, ...] = ()
+    receiver_series: tuple[Series, ...] = ()
+
+
+# number of flow selections get_raw_flow_data() keeps per LrcFile
+_RAW_FLOW_CACHE_SIZE = 16
 
 
 def _is_flow_measurement_result(result: BaseResult) -> bool:
@@ -66,6 +74,30 @@ def _get_cpu_metrics(lnst_run: RecipeRun, evaluated_cpu_metrics: list[str]) -> d
     }
 
 
+def _get_evaluation_data(lnst_run: RecipeRun, result_type: type) -> dict[str, float]:
+    """
+    Returns dict of `result_type` metrics evaluated by BaselineEvaluator
+    """
+    from lnst.RecipeCommon.Perf.Evaluators.BaselineEvaluator import BaselineEvaluationResult
+
+    evaluation_data = {}
+
+    for result in lnst_run.results:
+        if not isinstance(result, BaselineEvaluationResult):
+            continue
+
+        for comparison in result.data["comparisons"]:
+            if not isinstance(comparison["current_result"], result_type):
+                continue
+
+            evaluated_metric = comparison["metric_name"]
+            evaluated_metric_name = evaluated_metric[4:]
+
+            evaluation_data[evaluated_metric] = getattr(comparison["current_result"], evaluated_metric_name).average
+
+    return evaluation_data
+
+
 def _get_cpu_data(lnst_run: RecipeRun) -> list[Run]:
     try:
         m1_results, m2_results = filter(_is_cpu_measurement_result, lnst_run.results)
@@ -75,11 +107,12 @@ def _get_cpu_data(lnst_run: RecipeRun) -> list[Run]:
     number_of_runs = len(m1_results.data["cpu"])
     runs: list[Run] = []
     for run_index in range(number_of_runs):
-        run = Run(label=f"iteration{run_index}")
+        generator_series: list[Series] = []
+        receiver_series: list[Series] = []
 
         for results, run_series in [
-            (m1_results.data, run.generator_series),
-            (m2_results.data, run.receiver_series),
+            (m1_results.data, generator_series),
+            (m2_results.data, receiver_series),
         ]:
             # individual cpus
             for cpu_name, cpu_data in results.items():
@@ -93,7 +126,7 @@ def _get_cpu_data(lnst_run: RecipeRun) -> list[Run]:
 
                 new_series = Series(label=cpu_name, data=aggregated_cpu_data)
                 run_series.append(new_series)
-        runs.append(run)
+        runs.append(Run(f"iteration{run_index}", generator_series, receiver_series))
     return runs
 
 
@@ -138,7 +171,14 @@ def _get_flow_data(lnst_run: RecipeRun) -> list[_Flow]:
                 functools.reduce(aggregate_flows, run_data, [])
                 for run_data in flow_result.data["receiver_flow_data"]
             ]
-        flows.append(_Flow(is_aggregated, generator_data, receiver_data))
+        label = f"flow{flow_no}{'(agg)' if is_aggregated else ''}"
+        flows.append(
+            _Flow(
+                is_aggregated,
+                tuple(Series(label, tuple(data)) for data in generator_data),
+                tuple(Series(label, tuple(data)) for data in receiver_data),
+            )
+        )
     return flows
 
 
@@ -161,6 +201,14 @@ class LrcFile:
         evaluated_cpu_metrics: list[str] = ["cpu"],
         delete_loaded_data: bool = True,
     ):
+        """
+        With `delete_loaded_data` only the data extracted from the recipe run
+        is kept, otherwise the whole recipe run is kept in `data`.
+        """
+        from lnst.Controller.Recipe import import_recipe_run
+        from lnst.RecipeCommon.Perf.Measurements.Results.CPUMeasurementResults import CPUMeasurementResults
+        from lnst.RecipeCommon.Perf.Measurements.Results.FlowMeasurementResults import FlowMeasurementResults
+
         self.filename = filename
         recipe_run: RecipeRun = import_recipe_run(self.filename)
 
@@ -168,9 +216,14 @@ class LrcFile:
         # the relevant parts of it
         self._flow_metrics = _get_flow_metrics(recipe_run, evaluated_flow_metrics)
         self._cpu_metrics = _get_cpu_metrics(recipe_run, evaluated_cpu_metrics)
+        self._cpu_evaluation_data = _get_evaluation_data(recipe_run, CPUMeasurementResults)
+        self._flow_evaluation_data = _get_evaluation_data(recipe_run, FlowMeasurementResults)
 
         self._cpu_data = _get_cpu_data(recipe_run)
         self._flow_data = _get_flow_data(recipe_run)
+        self._raw_flow_cache: OrderedDict[
+            tuple[bool, Optional[frozenset[int]]], tuple[Run, ...]
+        ] = OrderedDict()
 
         self._recipe_params = recipe_run.recipe.params
         self._recipe_name = recipe_run.recipe.__class__.__name__
@@ -195,37 +248,41 @@ class LrcFile:
         return self._cpu_metrics
 
     @property
-    def evaluation_results(self):
-        return [
-            result
-            for result in self._data.results
-            if isinstance(result, BaselineEvaluationResult)
-        ]
-
-    def _evaluation_data(self, result_type: type):
+    def run_results(self) -> list[BaseResult]:
         """
-        Returns dict of `result_type` metrics evaluated by BaselineEvaluator
+        Returns all results of the run, requires `delete_loaded_data=False`
         """
-        evaluation_data = {}
+        if self._data is None:
+            raise Exception(f"Run results of '{self.filename}' were not kept loaded")
+        return self._data.results
 
-        for result in self.evaluation_results:
-            for comparison in result.data["comparisons"]:
-                if not isinstance(comparison["current_result"], result_type):
-                    continue
+    @property
+    def flow_performance_results(self) -> list[BaseResult]:
+        return list(filter(_is_flow_measurement_result, self.run_results))
 
-                evaluated_metric = comparison["metric_name"]
-                evaluated_metric_name = evaluated_metric[4:]
+    @property
+    def cpu_performance_results(self) -> list[BaseResult]:
+        return list(filter(_is_cpu_measurement_result, self.run_results))
 
-                evaluation_data[evaluated_metric] = getattr(comparison["current_result"], evaluated_metric_name).average
+    @property
+    def evaluation_results(self) -> list[BaseResult]:
+        """
+        Returns BaselineEvaluator results, requires `delete_loaded_data=False`
+        """
+        from lnst.RecipeCommon.Perf.Evaluators.BaselineEvaluator import BaselineEvaluationResult
 
-        return evaluation_data
+        return [
+            result
+            for result in self.run_results
+            if isinstance(result, BaselineEvaluationResult)
+        ]
 
     @property
     def cpu_evaluation_data(self) -> dict[str, float]:
         """
             Returns CPU metrics with its values used during evaluation.
         """
-        return self._evaluation_data(CPUMeasurementResults)
+        return self._cpu_evaluation_data
 
     @property
     def flow_result_data(self) -> dict[str, float]:
@@ -243,7 +300,7 @@ class LrcFile:
         """
             Returns flow metrics with its values used during evaluation.
         """
-        return self._evaluation_data(FlowMeasurementResults)
+        return self._flow_evaluation_data
 
     @property
     def recipe_params(self) -> Parameters:
@@ -281,37 +338,48 @@ class LrcFile:
     def evaluation_metrics(self) -> dict[str, float]:
         return {**self.cpu_evaluation_data, **self.flow_evaluation_data}
 
-    def get_raw_cpu_data(self) -> list[Run]:
+    def get_raw_cpu_data(self) -> Sequence[Run]:
         return self._cpu_data
 
     def get_raw_flow_data(
         self,
         aggregated_flows_only: bool = False,
-        flow_whitelist: Optional[list[int]] = None,
-    ) -> list[Run]:
-        runs: list[Run] = []
-        for run_no in range(len(self._flow_data[0].generator_data)):
-            run = Run(label=f"iteration{run_no}")
-            for flow_no, flow in enumerate(self._flow_data):
-
-                # skip flows not in whitelist
-                if flow_whitelist is not None and flow_no not in flow_whitelist:
-                    continue
-
-                # skip non-aggregated flows if only aggregated expected
-                if aggregated_flows_only and not flow.is_aggregated:
-                    continue
-
-                generator_series = Series(
-                    label=f"flow{flow_no}{'(agg)' if flow.is_aggregated else ''}",
-                    data=flow.generator_data[run_no],
-                    )
-                receiver_series = Series(
-                    label=f"flow{flow_no}{'(agg)' if flow.is_aggregated else ''}",
-                    data=flow.receiver_data[run_no],
-                )
-
-                run.generator_series.append(generator_series)
-                run.receiver_series.append(receiver_series)
-            runs.append(run)
+        flow_whitelist: Optional[Sequence[int]] = None,
+    ) -> Sequence[Run]:
+        """
+        Returns flow series of each run. Results are immutable and shared
+        between calls with the same arguments.
+        """
+        key = (
+            aggregated_flows_only,
+            None if flow_whitelist is None else frozenset(flow_whitelist),
+        )
+        if key in self._raw_flow_cache:
+            self._raw_flow_cache.move_to_end(key)
+            return self._raw_flow_cache[key]
+
+        _, whitelist = key
+        flows = [
+            flow
+            for flow_no, flow in enumerate(self._flow_data)
+            # skip flows not in whitelist and non-aggregated flows if only
+            # aggregated expected
+            if (whitelist is None or flow_no in whitelist)
+            and (not aggregated_flows_only or flow.is_aggregated)
+        ]
+        number_of_runs = (
+            len(self._flow_data[0].generator_series) if self._flow_data else 0
+        )
+        runs = tuple(
+            Run(
+                label=f"iteration{run_no}",
+                generator_series=tuple(flow.generator_series[run_no] for flow in flows),
+                receiver_series=tuple(flow.receiver_series[run_no] for flow in flows),
+            )
+            for run_no in range(number_of_runs)
+        )
+
+        self._raw_flow_cache[key] = runs
+        if len(self._raw_flow_cache) > _RAW_FLOW_CACHE_SIZE:
+            self._raw_flow_cache.popitem(last=False)
         return runs
@@ -1,9 +1,10 @@
 from typing import Optional
 
 from .LrcFile import LrcFile
+from .LrcExport import ExportMixin
 
 
-class LrcFileCollection:
+class LrcFileCollection(ExportMixin):
     _data_files: list[LrcFile]
 
     def __init__(self):
@@ -18,6 +19,10 @@ class LrcFileCollection:
         else:
             return self._data_files
 
+    @property
+    def data_files(self) -> list[LrcFile]:
+        return self._data_files
+
     @property
     def machines(self) -> list[set[str]]:
         return list(map(lambda x: x.machines, self._data_files))
@@ -0,0 +1,236 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+import bisect
+import fnmatch
+import math
+import statistics
+
+from .LrcFile import LrcFile, Run
+from .LrcSet import LrcSet
+
+
+@dataclass(frozen=True)
+class Regression:
+    """
+    A metric or raw series of a candidate run that differs significantly
+    from the baseline.
+
+    `score` is the z-score of the test, positive when the candidate value
+    is higher than the baseline, `p_value` is the two-sided p-value.
+    """
+    test_uuid: str
+    metric: str
+    test: str
+    candidate_value: float
+    baseline_value: float
+    score: float
+    p_value: float
+
+    @property
+    def direction(self) -> str:
+        return "increase" if self.score > 0 else "decrease"
+
+    @property
+    def relative_change(self) -> float:
+        """Change of the candidate value relative to the baseline value"""
+        if self.baseline_value == 0:
+            return math.copysign(math.inf, self.candidate_value)
+        return (self.candidate_value - self.baseline_value) / abs(self.baseline_value)
+
+
+# direction in which a change of a metric is a regression, the first
+# matching pattern applies, metrics matching none are checked both ways
+DEFAULT_BAD_DIRECTIONS = {
+    "*_cpu_data": "increase",
+    "*_flow_data": "decrease",
+    "*utilization": "increase",
+    "flow_*": "decrease",
+    "cpu_*": "increase",
+}
+
+
+def _two_sided_p_value(z: float) -> float:
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def _u_statistic(sample: list[float], sorted_baseline: list[float]) -> float:
+    """Mann-Whitney U statistic of `sample`, ties count as one half"""
+    u = 0.0
+    for x in sample:
+        lower = bisect.bisect_left(sorted_baseline, x)
+        upper = bisect.bisect_right(sorted_baseline, x, lo=lower)
+        u += lower + (upper - lower) / 2
+    return u
+
+
+def _sorted_median(data: list[float]) -> float:
+    middle = len(data) // 2
+    if len(data) % 2:
+        return data[middle]
+    return (data[middle - 1] + data[middle]) / 2
+
+
+def _pooled_series(runs: Sequence[Run], prefix: str) -> dict[str, list[float]]:
+    series: dict[str, list[float]] = {}
+    for run in runs:
+        for side, run_series in [
+            ("generator", run.generator_series),
+            ("receiver", run.receiver_series),
+        ]:
+            for s in run_series:
+                series.setdefault(f"{prefix}_{side}_{s.label}", []).extend(s.data)
+    return series
+
+
+def _raw_series(data_file: LrcFile) -> dict[str, list[float]]:
+    return {
+        **_pooled_series(data_file.get_raw_flow_data(), "flow"),
+        **_pooled_series(data_file.get_raw_cpu_data(), "cpu"),
+    }
+
+
+class LrcRegressionDetector:
+    """
+    LrcRegressionDetector tests metrics of candidate LrcFile objects against
+    the distribution of the same metrics in a baseline LrcSet.
+
+    Averaged metrics are checked with a z-score against the baseline mean
+    and standard deviation. Raw per-interval series are checked with a
+    Mann-Whitney U test (normal approximation, no tie correction) against
+    the series of all baseline files and iterations pooled together.
+
+    Only changes in the bad direction of a metric are reported, see
+    `bad_directions` (fnmatch patterns of metric names checked before
+    DEFAULT_BAD_DIRECTIONS, the direction is "increase", "decrease" or
+    "both"). Changes smaller than `min_relative_change` of the baseline
+    value are not reported however significant they are, long raw series
+    make even negligible shifts significant.
+
+    The baseline statistics are computed once, so each candidate costs
+    only a single pass over its own data.
+    """
+    _metric_stats: dict[str, tuple[float, float]]
+    _series: dict[str, list[float]]
+    _series_medians: dict[str, float]
+    _bad_directions: list[tuple[str, str]]
+
+    def __init__(
+        self,
+        baseline: LrcSet,
+        z_threshold: float = 3.0,
+        p_threshold: float = 0.001,
+        raw_series: bool = True,
+        min_relative_change: float = 0.05,
+        bad_directions: Optional[dict[str, str]] = None,
+    ):
+        self.z_threshold = z_threshold
+        self.p_threshold = p_threshold
+        self.min_relative_change = min_relative_change
+        self._bad_directions = [
+            *(bad_directions or {}).items(),
+            *DEFAULT_BAD_DIRECTIONS.items(),
+        ]
+
+        self._metric_stats = {}
+        for metric_name, values in baseline.metrics.items():
+            if len(values) < 2:
+                continue
+            self._metric_stats[metric_name] = (
+                statistics.fmean(values),
+                statistics.stdev(values),
+            )
+
+        self._series = {}
+        if raw_series:
+            for data_file in baseline.data_files:
+                for name, data in _raw_series(data_file).items():
+                    self._series.setdefault(name, []).extend(data)
+            for data in self._series.values():
+                data.sort()
+        self._series_medians = {
+            name: _sorted_median(data) for name, data in self._series.items()
+        }
+
+    def _bad_direction(self, metric: str) -> str:
+        for pattern, direction in self._bad_directions:
+            if fnmatch.fnmatchcase(metric, pattern):
+                return direction
+        return "both"
+
+    def _is_regression(self, regression: Regression) -> bool:
+        return (
+            self._bad_direction(regression.metric) in ("both", regression.direction)
+            and abs(regression.relative_change) >= self.min_relative_change
+        )
+
+    def _metric_regressions(self, candidate: LrcFile) -> list[Regression]:
+        regressions = []
+        for metric_name, value in candidate.metrics.items():
+            if metric_name not in self._metric_stats:
+                continue
+            mean, stdev = self._metric_stats[metric_name]
+            if stdev == 0:
+                if value == mean:
+                    continue
+                z = math.copysign(math.inf, value - mean)
+            else:
+                z = (value - mean) / stdev
+
+            if abs(z) >= self.z_threshold:
+                regressions.append(
+                    Regression(
+                        test_uuid=candidate.test_uuid,
+                        metric=metric_name,
+                        test="z-score",
+                        candidate_value=value,
+                        baseline_value=mean,
+                        score=z,
+                        p_value=_two_sided_p_value(z),
+                    )
+                )
+        return regressions
+
+    def _series_regressions(self, candidate: LrcFile) -> list[Regression]:
+        regressions = []
+        for name, data in _raw_series(candidate).items():
+            baseline = self._series.get(name)
+            if not baseline or not data:
+                continue
+
+            u = _u_statistic(data, baseline)
+            n1, n2 = len(data), len(baseline)
+            z = (u - n1 * n2 / 2) / math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+            p_value = _two_sided_p_value(z)
+
+            if p_value <= self.p_threshold:
+                regressions.append(
+                    Regression(
+                        test_uuid=candidate.test_uuid,
+                        metric=name,
+                        test="mann-whitney",
+                        candidate_value=statistics.median(data),
+                        baseline_value=self._series_medians[name],
+                        score=z,
+                        p_value=p_value,
+                    )
+                )
+        return regressions
+
+    def detect(self, candidate: LrcFile) -> list[Regression]:
+        """
+        Returns regressions of `candidate` in their bad direction ranked from
+        the most significant
+        """
+        regressions = self._metric_regressions(candidate)
+        if self._series:
+            regressions.extend(self._series_regressions(candidate))
+        return sorted(
+            filter(self._is_regression, regressions),
+            key=lambda r: (r.p_value, -abs(r.score)),
+        )
+
+    def detect_many(self, candidates: Iterable[LrcFile]) -> dict[str, list[Regression]]:
+        """
+        Returns regressions of all `candidates` keyed by their test uuid
+        """
+        return {candidate.test_uuid: self.detect(candidate) for candidate in candidates}
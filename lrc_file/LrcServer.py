@@ -0,0 +1,278 @@
+from collections import OrderedDict
+from typing import Any, Optional
+import json
+import logging
+import os
+import socket
+import socketserver
+import statistics
+import tempfile
+import threading
+
+from .LrcDir import LrcDir
+from .LrcFile import LrcFile
+from .LrcSets import LrcSets
+from .scripts.run_comparison import compare_lnst_runs_data
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = os.environ.get(
+    "LRC_SERVER_SOCKET",
+    os.path.join(tempfile.gettempdir(), f"lrc-server-{os.getuid()}.sock"),
+)
+
+# LrcSet properties the metrics and stats queries can return
+METRICS_TYPES = (
+    "metrics",
+    "evaluation_metrics",
+    "cpu_metrics",
+    "cpu_evaluation_metrics",
+    "flow_metrics",
+    "flow_evaluation_metrics",
+)
+
+
+def is_server_running(socket_path: str = DEFAULT_SOCKET_PATH) -> bool:
+    """Returns True if a server accepts connections on `socket_path`"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def _metric_stats(values: list[float]) -> dict[str, float]:
+    return {
+        "count": len(values),
+        "mean": statistics.fmean(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "_UnixServer"
+
+    def handle(self):
+        # one JSON object per line in both directions
+        for line in self.rfile:
+            try:
+                result = self.server.lrc_server.query(json.loads(line))
+                response = json.dumps({"ok": True, "result": result})
+            except Exception as e:
+                response = json.dumps(
+                    {"ok": False, "error": f"{e.__class__.__name__}: {e}"}
+                )
+            self.wfile.write(response.encode() + b"\n")
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    lrc_server: "LrcServer"
+
+
+class LrcServer:
+    """
+    LrcServer keeps data of an LrcDir loaded in LrcSets and answers queries
+    over a unix socket, so that short-lived clients don't have to load the
+    archive themselves. The directory is refreshed every `refresh_interval`
+    seconds, new files are loaded and removed files dropped.
+
+    The protocol is newline delimited JSON, each request is an object with
+    a "query" key, see LrcClient for the supported queries.
+
+    Comparisons need complete run results, which the LrcSets don't keep,
+    so up to `compare_cache_size` fully loaded files are cached for them.
+    Only files within the served directory can be compared.
+    """
+    _data_dir: LrcDir
+    _data_sets: LrcSets
+    _loaded_files: OrderedDict[str, tuple[float, LrcFile]]
+    _server: Optional[_UnixServer] = None
+
+    def __init__(
+        self,
+        dir_name: str,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        refresh_interval: float = 60.0,
+        compare_cache_size: int = 32,
+    ):
+        self.socket_path = socket_path
+        self.refresh_interval = refresh_interval
+        self.compare_cache_size = compare_cache_size
+
+        self._data_dir = LrcDir(dir_name)
+        self._data_sets = LrcSets(self._data_dir)
+        self._loaded_files = OrderedDict()
+        # LrcSets keeps filters as state, so queries have to be serialized
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._loaded_files_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def refresh(self) -> bool:
+        with self._refresh_lock:
+            if not self._data_dir.refresh():
+                return False
+
+            data_sets = LrcSets(self._data_dir)
+            with self._lock:
+                self._data_sets = data_sets
+            return True
+
+    def _refresh_loop(self):
+        while not self._stopped.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception(f"Refresh of '{self._data_dir.dir_name}' failed")
+
+    def _load_file(self, filename: str) -> LrcFile:
+        data_dir = os.path.realpath(self._data_dir.dir_name)
+        path = os.path.realpath(filename)
+        if os.path.commonpath([data_dir, path]) != data_dir:
+            raise Exception(f"File '{filename}' is not in the served directory")
+
+        mtime = os.path.getmtime(path)
+        with self._loaded_files_lock:
+            loaded_mtime, data_file = self._loaded_files.get(path, (None, None))
+            # files changed since they were loaded are loaded again
+            if data_file is not None and loaded_mtime == mtime:
+                self._loaded_files.move_to_end(path)
+                return data_file
+
+        # loading takes long, queries for other files must not wait for it
+        data_file = LrcFile(path, delete_loaded_data=False)
+
+        with self._loaded_files_lock:
+            self._loaded_files[path] = (mtime, data_file)
+            self._loaded_files.move_to_end(path)
+            while len(self._loaded_files) > self.compare_cache_size:
+                self._loaded_files.popitem(last=False)
+        return data_file
+
+    def _filtered_metrics(
+        self, request: dict[str, Any]
+    ) -> dict[str, dict[str, list[float]]]:
+        self._data_sets.data_filters = request.get("filters", {})
+        metrics_type = request.get("metrics_type", "metrics")
+        if metrics_type not in METRICS_TYPES:
+            raise Exception(f"Unknown metrics type '{metrics_type}'")
+        return {
+            ",".join(sorted(machines)): metrics
+            for machines, metrics in self._data_sets.map_data_sets(
+                lambda data_set: getattr(data_set, metrics_type)
+            ).items()
+        }
+
+    def query(self, request: dict[str, Any]) -> Any:
+        query = request.get("query")
+        if query == "ping":
+            return "pong"
+        elif query == "refresh":
+            return self.refresh()
+        elif query == "compare":
+            return compare_lnst_runs_data(
+                self._load_file(request["file1"]),
+                self._load_file(request["file2"]),
+                ignored_params=request.get("ignored_params", []),
+            )
+
+        with self._lock:
+            if query == "recipes":
+                return sorted(self._data_sets.recipes)
+            elif query == "metrics":
+                return self._filtered_metrics(request)
+            elif query == "stats":
+                return {
+                    machines: {
+                        metric_name: _metric_stats(values)
+                        for metric_name, values in metrics.items()
+                    }
+                    for machines, metrics in self._filtered_metrics(request).items()
+                }
+        raise Exception(f"Unknown query '{query}'")
+
+    def serve_forever(self):
+        if is_server_running(self.socket_path):
+            raise Exception(f"Server is already running on '{self.socket_path}'")
+        # left over by a server that didn't exit cleanly
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        refresh_thread.start()
+        with _UnixServer(self.socket_path, _RequestHandler) as server:
+            server.lrc_server = self
+            self._server = server
+            try:
+                server.serve_forever()
+            finally:
+                self._server = None
+                self._stopped.set()
+                if os.path.exists(self.socket_path):
+                    os.unlink(self.socket_path)
+
+    def shutdown(self):
+        """Stops serve_forever() running in another thread"""
+        if self._server is not None:
+            self._server.shutdown()
+
+
+class LrcClient:
+    """
+    LrcClient sends queries to a running LrcServer, supported queries are:
+        ping
+        refresh
+        recipes
+        metrics (filters, metrics_type, one of METRICS_TYPES)
+        stats (filters, metrics_type, one of METRICS_TYPES)
+        compare (file1, file2, ignored_params)
+    """
+    _socket: socket.socket
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        timeout: Optional[float] = None,
+    ):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(socket_path)
+        self._reader = self._socket.makefile("rb")
+
+    @classmethod
+    def connect(cls, socket_path: str = DEFAULT_SOCKET_PATH) -> Optional["LrcClient"]:
+        """
+        Returns a client connected to the server, None if no server is running
+        """
+        if not os.path.exists(socket_path):
+            return None
+        try:
+            return cls(socket_path)
+        except OSError:
+            return None
+
+    def query(self, query: str, **kwargs: Any) -> Any:
+        self._socket.sendall(json.dumps({"query": query, **kwargs}).encode() + b"\n")
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Server closed the connection")
+        response = json.loads(line)
+        if not response["ok"]:
+            raise Exception(f"Query '{query}' failed: {response['error']}")
+        return response["result"]
+
+    def close(self):
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self) -> "LrcClient":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
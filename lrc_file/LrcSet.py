@@ -1,9 +1,21 @@
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Sequence
+import math
+import statistics
 
 from .LrcFile import LrcFile
+from .LrcExport import ExportMixin
+from .LrcSummary import MetricSummary
 
 
-class LrcSet:
+_AGGREGATIONS: dict[str, Callable[[Sequence[float]], float]] = {
+    "mean": statistics.fmean,
+    "max": max,
+    "min": min,
+    "sum": math.fsum,
+}
+
+
+class LrcSet(ExportMixin):
     """
     LrcSet represents a set of LrcFile objects related to specific
     LNST machine set that match a filtering criteria specified by data_filters.
@@ -125,3 +137,104 @@ class LrcSet:
     @property
     def flow_evaluation_metrics(self) -> dict[str, list[float]]:
         return self._metrics("flow_evaluation_data")
+
+    def get_raw_series(
+        self,
+        series_label: str,
+        data_type: str = "flow",
+        side: str = "receiver",
+        length: Optional[int] = None,
+        fill_value: float = math.nan,
+        window: int = 1,
+        aggregation: str = "mean",
+    ) -> list[list[list[float]]]:
+        """
+        Returns raw per-interval data of a single series (flow or CPU) of
+        all files in the set stacked as files x iterations x intervals.
+
+        `series_label` is the label of the series as returned by
+        LrcFile.get_raw_flow_data() or LrcFile.get_raw_cpu_data(), e.g.
+        "flow0(agg)" or "cpu", `side` selects generator or receiver data.
+
+        Consecutive intervals are aggregated into windows of `window`
+        intervals using `aggregation` (one of "mean", "max", "min", "sum").
+        Ragged data is padded with `fill_value` to the longest series and
+        the highest number of iterations in the set, if `length` is given,
+        series are truncated or padded to it instead. `length` counts values
+        after aggregation, i.e. windows, not raw intervals.
+
+        Raises an exception if no file in the set contains `series_label`.
+        """
+        if data_type not in ("flow", "cpu"):
+            raise Exception(f"Unknown data type '{data_type}'")
+        if side not in ("generator", "receiver"):
+            raise Exception(f"Unknown side '{side}'")
+        if window < 1:
+            raise Exception("Window has to be a positive number of intervals")
+        try:
+            aggregate = _AGGREGATIONS[aggregation]
+        except KeyError:
+            raise Exception(f"Unknown aggregation '{aggregation}'")
+
+        files_data: list[list[list[float]]] = []
+        series_found = False
+        for data_file in self.data_files:
+            if data_type == "flow":
+                runs = data_file.get_raw_flow_data()
+            else:
+                runs = data_file.get_raw_cpu_data()
+
+            file_data: list[list[float]] = []
+            for run in runs:
+                run_series = (
+                    run.generator_series if side == "generator" else run.receiver_series
+                )
+                data = next(
+                    (s.data for s in run_series if s.label == series_label), None
+                )
+                if data is None:
+                    data = []
+                else:
+                    series_found = True
+                if window > 1:
+                    data = [
+                        aggregate(data[i:i + window])
+                        for i in range(0, len(data), window)
+                    ]
+                file_data.append(list(data))
+            files_data.append(file_data)
+
+        if self.data_files and not series_found:
+            raise Exception(
+                f"No {data_type} series '{series_label}' found in the data files"
+            )
+
+        if length is None:
+            length = max(
+                (len(data) for file_data in files_data for data in file_data),
+                default=0,
+            )
+        iterations = max((len(file_data) for file_data in files_data), default=0)
+
+        for file_data in files_data:
+            for i, data in enumerate(file_data):
+                file_data[i] = data[:length] + [fill_value] * (length - len(data))
+            file_data.extend(
+                [fill_value] * length for _ in range(iterations - len(file_data))
+            )
+
+        return files_data
+
+    def metric_summaries(
+        self,
+        metrics_type: str = "metrics",
+        relative_accuracy: float = 0.01,
+    ) -> dict[str, MetricSummary]:
+        """
+        Returns mergeable summaries of metrics of `metrics_type` (name of
+        a metrics property, e.g. "metrics" or "flow_metrics"), see LrcSummary
+        """
+        return {
+            metric_name: MetricSummary.from_values(values, relative_accuracy)
+            for metric_name, values in getattr(self, metrics_type).items()
+        }
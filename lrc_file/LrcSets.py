@@ -1,12 +1,22 @@
-from typing import Optional, Any
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Any, Callable, TypeVar, TYPE_CHECKING
 
 from .LrcFileCollection import LrcFileCollection
 from .LrcFile import LrcFile
 from .LrcSet import LrcSet
-from lnst.Common.Parameters import Parameters
+from .LrcExport import ExportMixin
+from .LrcSummary import MetricSummary
+
+if TYPE_CHECKING:
+    from lnst.Common.Parameters import Parameters
+
 
+T = TypeVar("T")
 
-class LrcSets:
+
+class LrcSets(ExportMixin):
     """
     LrcSets is a container of multiple LrcSet instances and provides
     methods to get aggregated data from them based on specified filters
@@ -40,6 +50,24 @@ class LrcSets:
     def data_filters(self, filters: dict[str, Any]):
         self._data_filters = filters
 
+    def _unique_data_sets(self) -> dict[frozenset[str], LrcSet]:
+        data_sets: dict[frozenset[str], LrcSet] = {}
+        for data_set in self.data_sets:
+            data_sets.setdefault(frozenset(data_set.machines), data_set)
+        return data_sets
+
+    @property
+    def data_files(self) -> list[LrcFile]:
+        """
+        Returns filtered data files of all data sets, each machine set
+        is included only once
+        """
+        return [
+            data_file
+            for data_set in self._unique_data_sets().values()
+            for data_file in data_set.data_files
+        ]
+
     @property
     def recipes(self) -> set[str]:
         return {
@@ -55,3 +83,68 @@ class LrcSets:
             for data_set in self.data_sets
             for data_file in data_set.data_files
         ]
+
+    def map_data_sets(
+        self,
+        func: Callable[[LrcSet], T],
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+    ) -> dict[frozenset[str], T]:
+        """
+        Evaluates `func` on every data set (with the current filters applied)
+        in a thread pool, or in a process pool if `use_processes` is set, in
+        which case both `func` and the data sets have to be picklable.
+
+        Returns results keyed by the machine set, ordered the same way as
+        `data_sets`. Data sets for the same machines are evaluated only once.
+        All data sets are evaluated even if some of them fail, the failures
+        are then reported together in a single exception raised from the
+        first failure in `data_sets` order.
+        """
+        data_sets = self._unique_data_sets()
+
+        executor: Executor
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        with executor:
+            futures = {
+                machines: executor.submit(func, data_set)
+                for machines, data_set in data_sets.items()
+            }
+
+        results: dict[frozenset[str], T] = {}
+        errors: dict[frozenset[str], BaseException] = {}
+        for machines, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                errors[machines] = error
+            else:
+                results[machines] = future.result()
+
+        if errors:
+            raise Exception(
+                "Evaluation failed for machine sets:\n"
+                + "\n".join(
+                    f"{sorted(machines)}: {error!r}"
+                    for machines, error in errors.items()
+                )
+            ) from next(iter(errors.values()))
+
+        return results
+
+    def metric_summaries(
+        self,
+        metrics_type: str = "metrics",
+        relative_accuracy: float = 0.01,
+    ) -> dict[frozenset[str], dict[str, MetricSummary]]:
+        """
+        Returns mergeable metric summaries of each data set keyed by its
+        machines, see LrcSet.metric_summaries()
+        """
+        return {
+            machines: data_set.metric_summaries(metrics_type, relative_accuracy)
+            for machines, data_set in self._unique_data_sets().items()
+        }
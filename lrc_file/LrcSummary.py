@@ -0,0 +1,211 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+import math
+
+
+@dataclass
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with logarithmic buckets (DDSketch), quantiles
+    are estimated with relative error of at most `relative_accuracy`.
+
+    Sketches with the same accuracy merge exactly, so the result does not
+    depend on how the values were split between them.
+    """
+    relative_accuracy: float = 0.01
+    positive: Counter[int] = field(default_factory=Counter)
+    negative: Counter[int] = field(default_factory=Counter)
+    zero_count: int = 0
+
+    @property
+    def _gamma(self) -> float:
+        return (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value, self._gamma))
+
+    def _value(self, index: int) -> float:
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    @property
+    def count(self) -> int:
+        return (
+            sum(self.positive.values())
+            + sum(self.negative.values())
+            + self.zero_count
+        )
+
+    def add(self, value: float):
+        if not math.isfinite(value):
+            raise Exception("Only finite values can be added to the sketch")
+        if value > 0:
+            self.positive[self._index(value)] += 1
+        elif value < 0:
+            self.negative[self._index(-value)] += 1
+        else:
+            self.zero_count += 1
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if self.relative_accuracy != other.relative_accuracy:
+            raise Exception("Only sketches with the same accuracy can be merged")
+
+        return QuantileSketch(
+            self.relative_accuracy,
+            self.positive + other.positive,
+            self.negative + other.negative,
+            self.zero_count + other.zero_count,
+        )
+
+    def quantile(self, q: float) -> float:
+        if not 0 <= q <= 1:
+            raise Exception("Quantile has to be between 0 and 1")
+        count = self.count
+        if not count:
+            return math.nan
+
+        rank = q * (count - 1)
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self.positive))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "positive": {str(k): v for k, v in self.positive.items()},
+            "negative": {str(k): v for k, v in self.negative.items()},
+            "zero_count": self.zero_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        return cls(
+            data["relative_accuracy"],
+            Counter({int(k): v for k, v in data["positive"].items()}),
+            Counter({int(k): v for k, v in data["negative"].items()}),
+            data["zero_count"],
+        )
+
+
+@dataclass
+class MetricSummary:
+    """
+    Summary of values of a single metric that can be serialized with
+    to_dict() and combined with summaries computed elsewhere using merge().
+
+    Non-finite values (NaN, infinity) are not summarized, only counted in
+    `skipped`.
+    """
+    count: int = 0
+    total: float = 0.0
+    total_squares: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    skipped: int = 0
+
+    @classmethod
+    def from_values(
+        cls, values: Iterable[float], relative_accuracy: float = 0.01
+    ) -> "MetricSummary":
+        summary = cls(sketch=QuantileSketch(relative_accuracy))
+        for value in values:
+            summary.add(value)
+        return summary
+
+    def add(self, value: float):
+        if not math.isfinite(value):
+            self.skipped += 1
+            return
+
+        self.count += 1
+        self.total += value
+        self.total_squares += value * value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.sketch.add(value)
+
+    def merge(self, other: "MetricSummary") -> "MetricSummary":
+        return MetricSummary(
+            self.count + other.count,
+            self.total + other.total,
+            self.total_squares + other.total_squares,
+            min(self.minimum, other.minimum),
+            max(self.maximum, other.maximum),
+            self.sketch.merge(other.sketch),
+            self.skipped + other.skipped,
+        )
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def variance(self) -> float:
+        """Sample variance"""
+        if self.count < 2:
+            return 0.0
+        variance = (
+            self.total_squares - self.total * self.total / self.count
+        ) / (self.count - 1)
+        # guard against rounding errors for (nearly) constant values
+        return max(variance, 0.0)
+
+    @property
+    def std_deviation(self) -> float:
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> float:
+        return self.sketch.quantile(q)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "total_squares": self.total_squares,
+            # empty summaries have infinite bounds, JSON can't represent them
+            "minimum": self.minimum if self.count else None,
+            "maximum": self.maximum if self.count else None,
+            "sketch": self.sketch.to_dict(),
+            "skipped": self.skipped,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MetricSummary":
+        return cls(
+            data["count"],
+            data["total"],
+            data["total_squares"],
+            math.inf if data["minimum"] is None else data["minimum"],
+            -math.inf if data["maximum"] is None else data["maximum"],
+            QuantileSketch.from_dict(data["sketch"]),
+            data.get("skipped", 0),
+        )
+
+
+def merge_summaries(
+    summaries: Iterable[dict[str, MetricSummary]]
+) -> dict[str, MetricSummary]:
+    """
+    Merges per-metric summaries, e.g. of the same LrcSet computed on
+    different hosts. Metrics missing in some of the summaries are merged
+    from the summaries that have them.
+    """
+    merged: dict[str, MetricSummary] = {}
+    for summary in summaries:
+        for metric_name, metric_summary in summary.items():
+            if metric_name in merged:
+                merged[metric_name] = merged[metric_name].merge(metric_summary)
+            else:
+                merged[metric_name] = metric_summary
+    return merged
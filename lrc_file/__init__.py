@@ -1,5 +1,56 @@
-from .LrcSets import LrcSets
-from .LrcFileCollection import LrcFileCollection
-from .LrcSet import LrcSet
-from .LrcDir import LrcDir
-from .LrcFile import LrcFile
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any
+
+# submodules are imported on first attribute access to keep
+# `import lrc_file` cheap for short-lived scripts
+_LAZY_ATTRS = {
+    "LrcSets": ".LrcSets",
+    "LrcFileCollection": ".LrcFileCollection",
+    "LrcSet": ".LrcSet",
+    "LrcDir": ".LrcDir",
+    "LrcFile": ".LrcFile",
+    "LrcRegressionDetector": ".LrcRegressionDetector",
+    "Regression": ".LrcRegressionDetector",
+    "MetricSummary": ".LrcSummary",
+    "merge_summaries": ".LrcSummary",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from .LrcSets import LrcSets
+    from .LrcFileCollection import LrcFileCollection
+    from .LrcSet import LrcSet
+    from .LrcDir import LrcDir
+    from .LrcFile import LrcFile
+    from .LrcRegressionDetector import LrcRegressionDetector, Regression
+    from .LrcSummary import MetricSummary, merge_summaries
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any):
+        # importing a submodule binds it to the package under its name,
+        # keep exporting the class of the same name instead
+        if name in _LAZY_ATTRS and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
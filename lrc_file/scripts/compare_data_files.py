@@ -1,26 +1,165 @@
 import os
 import sys
 import argparse
-import re
+import fnmatch
 import json
+import math
 
-from lrc_file.LrcFile import LrcFile
-from .run_comparison import compare_lnst_runs
+from .run_comparison import (
+    compare_lnst_runs_data,
+    format_lnst_runs_comparison,
+    format_run_info,
+)
 
 
 def main():
     args = parse_args()
 
-    run1 = LrcFile(args.file1)
-    run2 = LrcFile(args.file2)
-    compare_lnst_runs(
-        run1, run2, run_info=args.run_info, ignored_params=args.ignored_params
+    try:
+        pairs = get_file_pairs(args)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    loaded_files = {}
+
+    def load(filename):
+        # lnst is imported only once there is something to load
+        from lrc_file.LrcFile import LrcFile
+
+        if filename not in loaded_files:
+            loaded_files[filename] = LrcFile(filename, delete_loaded_data=False)
+        return loaded_files[filename]
+
+    client = None
+    if args.use_server:
+        from lrc_file.LrcServer import DEFAULT_SOCKET_PATH, LrcClient
+
+        client = LrcClient.connect(args.server_socket or DEFAULT_SOCKET_PATH)
+
+    def compare(file1, file2):
+        nonlocal client
+        result = None
+        if client is not None:
+            try:
+                result = client.query(
+                    "compare",
+                    file1=os.path.abspath(file1),
+                    file2=os.path.abspath(file2),
+                    ignored_params=args.ignored_params,
+                )
+            except (OSError, ValueError) as e:
+                # the connection can't be used after a broken response
+                print(f"lrc-server failed, loading files locally: {e}", file=sys.stderr)
+                client.close()
+                client = None
+            except Exception as e:
+                # e.g. files outside of the directory served by lrc-server
+                print(f"{e}, loading files locally", file=sys.stderr)
+        if result is None:
+            result = compare_lnst_runs_data(
+                load(file1), load(file2), ignored_params=args.ignored_params
+            )
+        # the server reports resolved paths, keep the output independent of it
+        result["run1"], result["run2"] = file1, file2
+        return result
+
+    try:
+        results = (compare(file1, file2) for file1, file2 in pairs)
+        if args.output_format == "text":
+            return print_text_results(results, load if args.run_info else None)
+        return print_results(results, args.output_format)
+    finally:
+        if client is not None:
+            client.close()
+
+
+def finite_values(data):
+    """
+    Replaces non-finite floats (e.g. ratios to a zero average) with None,
+    JSON has no representation for them
+    """
+    if isinstance(data, float) and not math.isfinite(data):
+        return None
+    elif isinstance(data, dict):
+        return {key: finite_values(value) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [finite_values(value) for value in data]
+    return data
+
+
+def print_text_results(results, load=None):
+    """
+    Prints each comparison under a header with the compared files, runs
+    that are not comparable are reported and the rest is still compared.
+    Run info is printed if `load` returning the LrcFile of a file is given.
+    """
+    all_comparable = True
+    for result in results:
+        print("Comparing runs: {} vs {}".format(result["run1"], result["run2"]))
+        if load is not None:
+            for filename in (result["run1"], result["run2"]):
+                run_info = format_run_info(load(filename))
+                print("\n".join(["\t" + line for line in run_info]))
+        print("\n".join(format_lnst_runs_comparison(result)), flush=True)
+        all_comparable = all_comparable and result["comparable"]
+
+    return 0 if all_comparable else 1
+
+
+def print_results(results, output_format):
+    printed_results = []
+    for result in results:
+        result = finite_values(result)
+        if output_format == "ndjson":
+            print(json.dumps(result, allow_nan=False), flush=True)
+        printed_results.append(result)
+
+    if output_format == "json":
+        print(json.dumps(printed_results, indent=2, allow_nan=False))
+
+    return 0 if all(result["comparable"] for result in printed_results) else 1
+
+
+def get_file_pairs(args):
+    if args.baseline_dir is None:
+        if len(args.files) < 2 or len(args.files) % 2:
+            raise ValueError("Files to compare have to be given in pairs")
+        return list(zip(args.files[::2], args.files[1::2]))
+
+    if not os.path.isdir(args.baseline_dir):
+        raise ValueError(f"Baseline directory '{args.baseline_dir}' does not exist")
+
+    baseline_files = sorted(
+        os.path.join(root, fname)
+        for root, _, files in os.walk(args.baseline_dir)
+        for fname in files
+        if fnmatch.fnmatch(fname, "*.lrc")
     )
+    if not baseline_files:
+        raise ValueError(f"No data files found in '{args.baseline_dir}'")
+    if not args.files:
+        raise ValueError("No candidate files to compare with the baseline")
+    for candidate in args.files:
+        if not os.path.isfile(candidate):
+            raise ValueError(f"Data file '{candidate}' does not exist")
+
+    # candidates within the baseline directory are not compared with themselves
+    pairs = [
+        (baseline_file, candidate)
+        for candidate in args.files
+        for baseline_file in baseline_files
+        if not os.path.samefile(baseline_file, candidate)
+    ]
+    if not pairs:
+        raise ValueError(f"No other data files found in '{args.baseline_dir}'")
+    return pairs
 
 
 def parse_args():
     parser = argparse.ArgumentParser(
-        description="Compare two lnst run data files",
+        description="Compare lnst run data files. Files are compared in "
+        "pairs, or each of them with every file in a baseline directory.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
     parser.add_argument(
@@ -38,7 +177,42 @@ def parse_args():
         default=[],
         help="Do not consider specified parameter for comparison",
     )
-    parser.add_argument("file1", type=str, help="First file to compare")
-    parser.add_argument("file2", type=str, help="Second file to compare")
+    parser.add_argument(
+        "-b",
+        "--baseline-dir",
+        dest="baseline_dir",
+        default=None,
+        help="Compare each of the files with every file in this directory",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="output_format",
+        choices=["text", "json", "ndjson"],
+        default="text",
+        help="Output format, ndjson prints one result per line as soon as "
+        "it is available",
+    )
+    parser.add_argument(
+        "--server-socket",
+        dest="server_socket",
+        default=None,
+        help="Socket of lrc-server to use for comparisons, files are "
+        "loaded locally if the server is not running or fails "
+        "(default: $LRC_SERVER_SOCKET or lrc-server's default socket)",
+    )
+    parser.add_argument(
+        "--no-server",
+        dest="use_server",
+        action="store_false",
+        help="Always load files locally, even if lrc-server is running",
+    )
+    parser.add_argument(
+        "files",
+        type=str,
+        nargs="*",
+        help="Pairs of files to compare (file1 file2 [file3 file4 ...]), "
+        "or candidate files when --baseline-dir is used",
+    )
 
     return parser.parse_args()
@@ -0,0 +1,55 @@
+import argparse
+import logging
+import signal
+import sys
+
+from lrc_file.LrcServer import DEFAULT_SOCKET_PATH, LrcServer, is_server_running
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if is_server_running(args.socket_path):
+        print(
+            f"lrc-server is already running on '{args.socket_path}'", file=sys.stderr
+        )
+        return 1
+
+    server = LrcServer(
+        args.dir_name,
+        socket_path=args.socket_path,
+        refresh_interval=args.refresh_interval,
+    )
+    # exit through SystemExit, so that the socket gets removed
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Keep lnst run data files of a directory loaded and "
+        "answer queries about them over a unix socket",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "-s",
+        "--socket",
+        dest="socket_path",
+        default=DEFAULT_SOCKET_PATH,
+        help="Path of the unix socket to listen on",
+    )
+    parser.add_argument(
+        "-r",
+        "--refresh-interval",
+        dest="refresh_interval",
+        type=float,
+        default=60.0,
+        help="Seconds between checks of the directory for new files",
+    )
+    parser.add_argument("dir_name", type=str, help="Directory with data files")
+
+    return parser.parse_args()
@@ -2,11 +2,11 @@ import re
 
 
 def compare_lnst_runs(run1, run2, run_info=False, ignored_params=[]):
-    errors = validate_runs_comparable(run1, run2, ignored_params)
+    comparison = compare_lnst_runs_data(run1, run2, ignored_params)
 
-    if errors:
+    if not comparison["comparable"]:
         raise Exception(
-            "Runs not comparable, errors:\n{}".format("\n".join(errors))
+            "Runs not comparable, errors:\n{}".format("\n".join(comparison["errors"]))
         )
     else:
         print("Comparing runs:")
@@ -14,16 +14,79 @@ def compare_lnst_runs(run1, run2, run_info=False, ignored_params=[]):
             print("\n".join(["\t" + line for line in format_run_info(run1)]))
             print("\n".join(["\t" + line for line in format_run_info(run2)]))
 
-        print("Simple run results comparison:")
-        simple_comparison = simple_compare_run_results(run1, run2)
-        if len(simple_comparison):
-            print("\n".join(["\t" + line for line in simple_comparison]))
-        else:
-            print("\tRun results simply match")
+        print("\n".join(format_lnst_runs_comparison(comparison)))
+
+
+def format_lnst_runs_comparison(comparison):
+    """
+    Formats a comparison returned by compare_lnst_runs_data() as the lines
+    printed by compare_lnst_runs()
+    """
+    if not comparison["comparable"]:
+        return ["Runs not comparable, errors:"] + comparison["errors"]
+
+    lines = ["Simple run results comparison:"]
+    if len(comparison["result_mismatches"]):
+        lines.extend(["\t" + line for line in comparison["result_mismatches"]])
+    else:
+        lines.append("\tRun results simply match")
+
+    lines.append("Measurement comparison:")
+    for flow in comparison["flows"]:
+        lines.append("\tFlow comparison:")
+        lines.extend(
+            [
+                "\t\t{} run1 run2 {}".format(name, format_measurement_comparison(metric))
+                for name, metric in flow.items()
+            ]
+        )
+    for cpu in comparison["cpus"]:
+        lines.append("\tHosts: {} vs {}".format(cpu["host1"], cpu["host2"]))
+        lines.extend(
+            [
+                "\t\tcore1 {} core2 {} {}".format(
+                    core["core1"], core["core2"], format_measurement_comparison(core)
+                )
+                for core in cpu["cores"]
+            ]
+        )
+    return lines
+
 
-        print("Measurement comparison:")
-        measurement_comparison = compare_run_measurements(run1, run2)
-        print("\n".join(["\t" + line for line in measurement_comparison]))
+def compare_lnst_runs_data(run1, run2, ignored_params=[]):
+    """
+    Structured counterpart of compare_lnst_runs(), returns the comparison
+    as a JSON serializable dict instead of printing it. Runs that are not
+    comparable are reported in "errors" instead of raising an exception.
+    """
+    errors = validate_runs_comparable(run1, run2, ignored_params)
+    result = {
+        "run1": run1.filename,
+        "run2": run2.filename,
+        "comparable": not errors,
+        "errors": errors,
+    }
+    if errors:
+        return result
+
+    result["result_mismatches"] = simple_compare_run_results(run1, run2)
+    result["flows"] = [
+        compare_flow_results_data(result1, result2)
+        for result1, result2 in generate_flow_measurement_pairs(
+            run1.flow_performance_results, run2.flow_performance_results
+        )
+    ]
+    result["cpus"] = [
+        {
+            "host1": get_cpu_hostid(result1),
+            "host2": get_cpu_hostid(result2),
+            "cores": compare_cpu_results_data(result1, result2),
+        }
+        for result1, result2 in generate_cpu_measurement_pairs(
+            run1.cpu_performance_results, run2.cpu_performance_results
+        )
+    ]
+    return result
 
 
 def validate_runs_comparable(run1, run2, ignored_params):
@@ -148,81 +211,51 @@ def generate_flow_measurement_pairs(flows1, flows2):
     return zip(flows1, flows2)
 
 
-def compare_flow_results(result1, result2):
-    data1 = result1.data
-    data2 = result2.data
-
-    results = [
-        "generator_throughput run1 run2 difference={:.2%}, abs={:.2f}; {:.2f}, deviations={:.2%}; {:.2%}".format(
-            calculate_ratio(
-                data1["generator_flow_data"].average,
-                data2["generator_flow_data"].average,
-            )
-            - 1,
-            data1["generator_flow_data"].average,
-            data2["generator_flow_data"].average,
-            calculate_ratio(
-                data1["generator_flow_data"].std_deviation,
-                data1["generator_flow_data"].average,
-            ),
-            calculate_ratio(
-                data2["generator_flow_data"].std_deviation,
-                data2["generator_flow_data"].average,
-            ),
-        ),
-        "receiver_throughput run1 run2 difference={:.2%}, abs={:.2f}; {:.2f}, deviations={:.2%}; {:.2%}".format(
-            calculate_ratio(
-                data1["receiver_flow_data"].average,
-                data2["receiver_flow_data"].average,
-            )
-            - 1,
-            data1["receiver_flow_data"].average,
-            data2["receiver_flow_data"].average,
-            calculate_ratio(
-                data1["receiver_flow_data"].std_deviation,
-                data1["receiver_flow_data"].average,
-            ),
-            calculate_ratio(
-                data2["receiver_flow_data"].std_deviation,
-                data2["receiver_flow_data"].average,
-            ),
-        ),
-        "generator_cpu_data run1 run2 difference={:.2%}, abs={:.2f}; {:.2f}, deviations={:.2%}; {:.2%}".format(
-            calculate_ratio(
-                data1["generator_cpu_data"].average,
-                data2["generator_cpu_data"].average,
-            )
-            - 1,
-            data1["generator_cpu_data"].average,
-            data2["generator_cpu_data"].average,
-            calculate_ratio(
-                data1["generator_cpu_data"].std_deviation,
-                data1["generator_cpu_data"].average,
-            ),
-            calculate_ratio(
-                data2["generator_cpu_data"].std_deviation,
-                data2["generator_cpu_data"].average,
-            ),
+FLOW_COMPARISON_METRICS = [
+    ("generator_throughput", "generator_flow_data"),
+    ("receiver_throughput", "receiver_flow_data"),
+    ("generator_cpu_data", "generator_cpu_data"),
+    ("receiver_cpu_data", "receiver_cpu_data"),
+]
+
+
+def compare_measurements(measurement1, measurement2):
+    return {
+        "difference": calculate_ratio(measurement1.average, measurement2.average)
+        - 1,
+        "run1": measurement1.average,
+        "run2": measurement2.average,
+        "run1_deviation": calculate_ratio(
+            measurement1.std_deviation, measurement1.average
         ),
-        "receiver_cpu_data run1 run2 difference={:.2%}, abs={:.2f}; {:.2f}, deviations={:.2%}; {:.2%}".format(
-            calculate_ratio(
-                data1["receiver_cpu_data"].average,
-                data2["receiver_cpu_data"].average,
-            )
-            - 1,
-            data1["receiver_cpu_data"].average,
-            data2["receiver_cpu_data"].average,
-            calculate_ratio(
-                data1["receiver_cpu_data"].std_deviation,
-                data1["receiver_cpu_data"].average,
-            ),
-            calculate_ratio(
-                data2["receiver_cpu_data"].std_deviation,
-                data2["receiver_cpu_data"].average,
-            ),
+        "run2_deviation": calculate_ratio(
+            measurement2.std_deviation, measurement2.average
         ),
+    }
+
+
+def format_measurement_comparison(comparison):
+    return "difference={:.2%}, abs={:.2f}; {:.2f}, deviations={:.2%}; {:.2%}".format(
+        comparison["difference"],
+        comparison["run1"],
+        comparison["run2"],
+        comparison["run1_deviation"],
+        comparison["run2_deviation"],
+    )
+
+
+def compare_flow_results_data(result1, result2):
+    return {
+        name: compare_measurements(result1.data[key], result2.data[key])
+        for name, key in FLOW_COMPARISON_METRICS
+    }
+
+
+def compare_flow_results(result1, result2):
+    return [
+        "{} run1 run2 {}".format(name, format_measurement_comparison(comparison))
+        for name, comparison in compare_flow_results_data(result1, result2).items()
     ]
-    return results
 
 
 def compare_cpu_run_results(run1, run2):
@@ -246,24 +279,22 @@ def generate_cpu_measurement_pairs(cpus1, cpus2):
     return zip(sorted_cpus1, sorted_cpus2)
 
 
+def compare_cpu_results_data(result1, result2):
+    return [
+        {"core1": core1[0], "core2": core2[0], **compare_measurements(core1[1], core2[1])}
+        for core1, core2 in zip(result1.data.items(), result2.data.items())
+    ]
+
+
 def compare_cpu_results(result1, result2):
-    results = []
-    data1 = result1.data
-    data2 = result2.data
-
-    for core1, core2 in zip(data1.items(), data2.items()):
-        results.append(
-            "core1 {} core2 {} difference={:.2%}, abs={:.2f}; {:.2f}, deviations={:.2%}; {:.2%}".format(
-                core1[0],
-                core2[0],
-                calculate_ratio(core1[1].average, core2[1].average) - 1,
-                core1[1].average,
-                core2[1].average,
-                calculate_ratio(core1[1].std_deviation, core1[1].average),
-                calculate_ratio(core2[1].std_deviation, core2[1].average),
-            ),
+    return [
+        "core1 {} core2 {} {}".format(
+            comparison["core1"],
+            comparison["core2"],
+            format_measurement_comparison(comparison),
         )
-    return results
+        for comparison in compare_cpu_results_data(result1, result2)
+    ]
 
 
 def get_cpu_hostid(result):
@@ -0,0 +1,226 @@
+"""
+The tests don't need lnst, a minimal stand-in with the same module and
+class layout is registered in sys.modules instead, so that exported recipe
+runs can be created and unpickled the same way lnst does it.
+"""
+import lzma
+import pickle
+import random
+import sys
+import types
+
+import pytest
+
+
+_FAKE_LNST_MODULES = {
+    "lnst": "",
+    "lnst.Common": "",
+    "lnst.Common.Parameters": """
+class Parameters:
+    def __init__(self, **params):
+        self.__dict__.update(params)
+
+    def __contains__(self, name):
+        return name in self.__dict__
+
+    def _to_dict(self):
+        return dict(self.__dict__)
+""",
+    "lnst.Controller": "",
+    "lnst.Controller.Recipe": """
+import lzma
+import pickle
+
+class RecipeRun:
+    def __init__(self, recipe, match, environ, results):
+        self.recipe = recipe
+        self.match = match
+        self.environ = environ
+        self.results = results
+
+def import_recipe_run(path):
+    with lzma.open(path, "rb") as f:
+        return pickle.load(f)
+""",
+    "lnst.Controller.RecipeResults": """
+class BaseResult:
+    def __init__(self, success=True):
+        self.success = success
+
+class Result(BaseResult):
+    def __init__(self, success=True, description="", data=None):
+        super().__init__(success)
+        self.description = description
+        self.data = data
+
+class JobFinishResult(BaseResult):
+    def __init__(self, job_output):
+        super().__init__()
+        self.job_output = job_output
+
+    @property
+    def data(self):
+        return self.job_output
+""",
+    "lnst.RecipeCommon": "",
+    "lnst.RecipeCommon.Perf": "",
+    "lnst.RecipeCommon.Perf.Results": """
+class PerfInterval:
+    def __init__(self, average):
+        self.average = average
+
+class PerfList(list):
+    def __init__(self, items, average, std_deviation=0.0):
+        super().__init__(items)
+        self.average = average
+        self.std_deviation = std_deviation
+""",
+    "lnst.RecipeCommon.Perf.Measurements": "",
+    "lnst.RecipeCommon.Perf.Measurements.Results": "",
+    "lnst.RecipeCommon.Perf.Measurements.Results.FlowMeasurementResults": """
+class Flow:
+    def __init__(self, aggregated_flow):
+        self.aggregated_flow = aggregated_flow
+
+class FlowMeasurementResults:
+    def __init__(self, flow):
+        self.flow = flow
+""",
+    "lnst.RecipeCommon.Perf.Measurements.Results.CPUMeasurementResults": """
+class CPUMeasurementResults:
+    def __init__(self, utilization):
+        self.utilization = utilization
+""",
+    "lnst.RecipeCommon.Perf.Evaluators": "",
+    "lnst.RecipeCommon.Perf.Evaluators.BaselineEvaluator": """
+from lnst.Controller.RecipeResults import Result
+
+class BaselineEvaluationResult(Result):
+    pass
+""",
+    "lnst.Recipes": "",
+    "lnst.Recipes.ENRT": """
+class SimpleNetworkRecipe:
+    def __init__(self, params):
+        self.params = params
+""",
+}
+
+for _name, _source in _FAKE_LNST_MODULES.items():
+    _module = types.ModuleType(_name)
+    _module.__path__ = []  # type: ignore
+    sys.modules[_name] = _module
+    exec(_source, _module.__dict__)
+    if "." in _name:
+        _parent, _, _child = _name.rpartition(".")
+        setattr(sys.modules[_parent], _child, _module)
+
+
+def _perf_list(rng, runs, parallel, intervals, base):
+    return sys.modules["lnst.RecipeCommon.Perf.Results"].PerfList(
+        [
+            [
+                [
+                    sys.modules["lnst.RecipeCommon.Perf.Results"].PerfInterval(
+                        base + rng.random()
+                    )
+                    for _ in range(intervals)
+                ]
+                for _ in range(parallel)
+            ]
+            for _ in range(runs)
+        ],
+        average=base,
+        std_deviation=base / 100,
+    )
+
+
+def make_recipe_run(seed, machines, runs=3, intervals=10, base=100.0, **params):
+    from lnst.Common.Parameters import Parameters
+    from lnst.Controller.Recipe import RecipeRun
+    from lnst.Controller.RecipeResults import JobFinishResult, Result
+    from lnst.Recipes.ENRT import SimpleNetworkRecipe
+    from lnst.RecipeCommon.Perf.Evaluators.BaselineEvaluator import BaselineEvaluationResult
+    from lnst.RecipeCommon.Perf.Measurements.Results.CPUMeasurementResults import CPUMeasurementResults
+    from lnst.RecipeCommon.Perf.Measurements.Results.FlowMeasurementResults import (
+        Flow,
+        FlowMeasurementResults,
+    )
+
+    rng = random.Random(seed)
+    results = [JobFinishResult(list(range(10000)))]
+    for aggregated in (False, True):
+        # aggregated flows have the data a level deeper
+        parallel = 1 if aggregated else 2
+
+        def side(base):
+            data = _perf_list(rng, runs, parallel, intervals, base)
+            if aggregated:
+                data[:] = [[run_data] for run_data in data]
+            return data
+
+        results.append(
+            Result(
+                data={
+                    "generator_flow_data": side(base),
+                    "receiver_flow_data": side(base),
+                    "generator_cpu_data": side(10.0),
+                    "receiver_cpu_data": side(11.0),
+                    "flow_results": FlowMeasurementResults(Flow(aggregated)),
+                }
+            )
+        )
+
+    for host in ("host1", "host2"):
+        results.append(
+            Result(
+                description=f"CPU Utilization on host {host}:",
+                data={"cpu": _perf_list(rng, runs, 2, intervals, 40.0)},
+            )
+        )
+
+    evaluated = CPUMeasurementResults(_perf_list(rng, 1, 1, 1, 42.0))
+    results.append(
+        BaselineEvaluationResult(
+            data={
+                "comparisons": [
+                    {"current_result": evaluated, "metric_name": "cpu_utilization"}
+                ]
+            }
+        )
+    )
+
+    return RecipeRun(
+        recipe=SimpleNetworkRecipe(
+            Parameters(
+                **{
+                    "ip_versions": ("ipv4",),
+                    "perf_tests": ("tcp_stream",),
+                    "mtu": 1500,
+                    **params,
+                }
+            )
+        ),
+        match={
+            "machines": {
+                "host1": {"hostname": machines[0]},
+                "host2": {"hostname": machines[1]},
+            }
+        },
+        environ={"LNST_TEST_UUID": f"uuid-{seed}"},
+        results=results,
+    )
+
+
+def write_lrc_file(path, *args, **kwargs):
+    with lzma.open(path, "wb") as f:
+        pickle.dump(make_recipe_run(*args, **kwargs), f)
+    return str(path)
+
+
+@pytest.fixture
+def lrc_dir(tmp_path):
+    for i in range(6):
+        machines = ("wsfdA", "wsfdB") if i % 2 else ("wsfdC", "wsfdD")
+        write_lrc_file(tmp_path / f"run{i}.lrc", i, machines, intervals=10 + i % 3)
+    return str(tmp_path)
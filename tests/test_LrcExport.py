@@ -0,0 +1,83 @@
+import csv
+import os
+
+import pytest
+
+from lrc_file import LrcDir, LrcSets
+from lrc_file.LrcExport import METADATA_COLUMNS, RAW_SERIES_COLUMNS, ExportMixin
+
+
+def _read_csv(filename):
+    with open(filename, newline="") as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+def test_export_metrics_csv(lrc_dir, tmp_path):
+    data_sets = LrcSets(LrcDir(lrc_dir))
+    filename = tmp_path / "metrics.csv"
+
+    data_sets.export_metrics(str(filename), chunk_size=4)
+
+    columns, rows = _read_csv(filename)
+    assert columns[: len(METADATA_COLUMNS)] == METADATA_COLUMNS
+    assert sorted(row["test_uuid"] for row in rows) == [f"uuid-{i}" for i in range(6)]
+    metric_names = columns[len(METADATA_COLUMNS):]
+    assert "1_generator_flow_data" in metric_names
+    assert {row["machines"] for row in rows} == {"wsfdA,wsfdB", "wsfdC,wsfdD"}
+
+    data_file = data_sets.data_files[0]
+    row = next(row for row in rows if row["test_uuid"] == data_file.test_uuid)
+    assert {name: float(row[name]) for name in metric_names} == data_file.metrics
+
+
+def test_export_raw_series_csv(lrc_dir, tmp_path):
+    data_dir = LrcDir(lrc_dir)
+    filename = tmp_path / "raw.csv"
+
+    data_dir.export_raw_series(str(filename), chunk_size=100)
+
+    columns, rows = _read_csv(filename)
+    assert columns == RAW_SERIES_COLUMNS
+    # 2 flows and 1 CPU series on both sides for each of 3 iterations
+    intervals = sum(10 + i % 3 for i in range(6))
+    assert len(rows) == 3 * 2 * 3 * intervals
+
+    data_file = data_dir.data_files[0]
+    flow_series = data_file.get_raw_flow_data()[2].receiver_series[1]
+    values = [
+        float(row["value"])
+        for row in rows
+        if row["test_uuid"] == data_file.test_uuid
+        and row["data_type"] == "flow"
+        and row["side"] == "receiver"
+        and row["iteration"] == "2"
+        and row["series"] == flow_series.label
+    ]
+    assert values == list(flow_series.data)
+
+
+def test_export_raw_series_parquet(lrc_dir, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    filename = tmp_path / "raw.parquet"
+
+    LrcDir(lrc_dir).export_raw_series(str(filename), "parquet", chunk_size=100)
+
+    table = parquet.read_table(filename)
+    assert table.column_names == RAW_SERIES_COLUMNS
+    assert str(table.schema.field("interval").type) == "int64"
+    assert str(table.schema.field("value").type) == "double"
+    assert table.num_rows == 3 * 2 * 3 * sum(10 + i % 3 for i in range(6))
+
+
+def test_unknown_format(lrc_dir, tmp_path):
+    with pytest.raises(Exception, match="Unknown export format"):
+        LrcDir(lrc_dir).export_metrics(str(tmp_path / "metrics.xlsx"), "xlsx")
+
+
+def test_export_mixin_requires_data_files():
+    class Collection(ExportMixin):
+        pass
+
+    with pytest.raises(TypeError):
+        Collection()
@@ -0,0 +1,69 @@
+import os
+import pickle
+
+import pytest
+
+from lrc_file import LrcFile
+from lrc_file.LrcFile import _RAW_FLOW_CACHE_SIZE
+
+
+def test_extracted_data_matches_full_load(lrc_dir):
+    filename = os.path.join(lrc_dir, "run0.lrc")
+
+    extracted = LrcFile(filename)
+    full = LrcFile(filename, delete_loaded_data=False)
+
+    assert extracted.metrics
+    assert extracted.metrics == full.metrics
+    assert extracted.get_raw_flow_data() == full.get_raw_flow_data()
+    assert extracted.get_raw_cpu_data() == full.get_raw_cpu_data()
+    assert extracted.evaluation_metrics == {"cpu_utilization": 42.0}
+    assert extracted.evaluation_metrics == full.evaluation_metrics
+
+
+def test_loaded_results_are_not_kept(lrc_dir):
+    data_file = LrcFile(os.path.join(lrc_dir, "run0.lrc"))
+
+    assert data_file.evaluation_metrics == {"cpu_utilization": 42.0}
+    # no lnst results are referenced once the data are extracted
+    pickled = pickle.dumps(data_file)
+    assert b"lnst.Controller.RecipeResults" not in pickled
+    assert b"lnst.RecipeCommon.Perf" not in pickled
+    with pytest.raises(Exception):
+        data_file.evaluation_results
+
+
+def test_raw_flow_data_is_shared(lrc_dir):
+    data_file = LrcFile(os.path.join(lrc_dir, "run0.lrc"))
+
+    runs = data_file.get_raw_flow_data()
+    assert data_file.get_raw_flow_data() is runs
+    whitelisted = data_file.get_raw_flow_data(flow_whitelist=[1, 0])
+    assert data_file.get_raw_flow_data(flow_whitelist=(0, 1)) is whitelisted
+    assert whitelisted is not runs and whitelisted == runs
+    # results are immutable, so that sharing them is safe
+    assert isinstance(runs, tuple)
+    assert isinstance(runs[0].receiver_series, tuple)
+    assert isinstance(runs[0].receiver_series[0].data, tuple)
+
+    aggregated = data_file.get_raw_flow_data(aggregated_flows_only=True)
+    assert [s.label for s in aggregated[0].generator_series] == ["flow1(agg)"]
+    flow0 = data_file.get_raw_flow_data(flow_whitelist=[0])
+    assert [s.label for s in flow0[0].generator_series] == ["flow0"]
+
+
+def test_raw_flow_data_cache_eviction(lrc_dir):
+    data_file = LrcFile(os.path.join(lrc_dir, "run0.lrc"))
+
+    first = data_file.get_raw_flow_data()
+    for flow_no in range(_RAW_FLOW_CACHE_SIZE):
+        data_file.get_raw_flow_data(flow_whitelist=[flow_no])
+    assert len(data_file._raw_flow_cache) == _RAW_FLOW_CACHE_SIZE
+
+    # evicted, equal but not the same object
+    runs = data_file.get_raw_flow_data()
+    assert runs == first and runs is not first
+
+    # the recently used selection is kept
+    data_file.get_raw_flow_data(flow_whitelist=[100])
+    assert data_file.get_raw_flow_data() is runs
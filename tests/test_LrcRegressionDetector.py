@@ -0,0 +1,56 @@
+import pytest
+
+from conftest import write_lrc_file
+from lrc_file import LrcDir, LrcFile, LrcRegressionDetector, LrcSet
+
+
+@pytest.fixture
+def baseline(lrc_dir):
+    data_dir = LrcDir(lrc_dir)
+    return LrcSet(data_dir.get_data_files(), machines=set())
+
+
+def _candidate(tmp_path, base):
+    return LrcFile(
+        write_lrc_file(tmp_path / "candidate.lrc", 100, ("wsfdA", "wsfdB"), base=base)
+    )
+
+
+def test_throughput_decrease_is_reported(baseline, tmp_path):
+    regressions = LrcRegressionDetector(baseline).detect(_candidate(tmp_path, 80.0))
+
+    metrics = {regression.metric for regression in regressions}
+    assert "1_generator_flow_data" in metrics
+    assert "flow_receiver_flow0" in metrics
+    assert all(regression.direction == "decrease" for regression in regressions)
+    assert all(regression.relative_change < -0.05 for regression in regressions)
+    # ranked from the most significant
+    assert regressions == sorted(regressions, key=lambda r: r.p_value)
+
+
+def test_throughput_increase_is_not_reported(baseline, tmp_path):
+    detector = LrcRegressionDetector(baseline)
+    candidate = _candidate(tmp_path, 120.0)
+
+    assert detector.detect(candidate) == []
+
+    detector = LrcRegressionDetector(
+        baseline, bad_directions={"flow_*": "both", "*_flow_data": "both"}
+    )
+    assert {r.direction for r in detector.detect(candidate)} == {"increase"}
+
+
+def test_small_changes_are_not_reported(baseline, tmp_path):
+    candidate = _candidate(tmp_path, 99.0)
+
+    assert LrcRegressionDetector(baseline).detect(candidate) == []
+    assert LrcRegressionDetector(baseline, min_relative_change=0).detect(candidate)
+
+
+def test_unchanged_candidate(baseline, lrc_dir):
+    detector = LrcRegressionDetector(baseline, raw_series=False)
+    candidates = baseline.data_files
+
+    assert detector.detect_many(candidates) == {
+        candidate.test_uuid: [] for candidate in candidates
+    }
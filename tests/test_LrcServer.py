@@ -0,0 +1,142 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from conftest import write_lrc_file
+from lrc_file.LrcServer import LrcClient, LrcServer, is_server_running
+from lrc_file.scripts import compare_data_files
+
+
+def _wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def server(lrc_dir, tmp_path):
+    lrc_server = LrcServer(lrc_dir, socket_path=str(tmp_path / "lrc.sock"))
+    thread = threading.Thread(target=lrc_server.serve_forever, daemon=True)
+    thread.start()
+    _wait_for(lambda: is_server_running(lrc_server.socket_path))
+    yield lrc_server
+    lrc_server.shutdown()
+    thread.join()
+
+
+def test_queries(server):
+    with LrcClient(server.socket_path) as client:
+        assert client.query("ping") == "pong"
+        assert client.query("recipes") == ["SimpleNetworkRecipe"]
+
+        metrics = client.query("metrics", metrics_type="cpu_metrics")
+        assert sorted(metrics) == ["wsfdA,wsfdB", "wsfdC,wsfdD"]
+        assert metrics["wsfdA,wsfdB"]["3_utilization"] == [40.0] * 3
+
+        stats = client.query("stats", filters={"params": {"mtu": 1500}})
+        assert stats["wsfdC,wsfdD"]["1_generator_flow_data"]["mean"] == 100.0
+        stats = client.query("stats", filters={"params": {"mtu": 9000}})
+        assert stats == {"wsfdA,wsfdB": {}, "wsfdC,wsfdD": {}}
+
+
+def test_invalid_query_keeps_connection(server):
+    with LrcClient(server.socket_path) as client:
+        with pytest.raises(Exception, match="Unknown metrics type"):
+            client.query("metrics", metrics_type="__class__")
+        with pytest.raises(Exception, match="Unknown query"):
+            client.query("drop")
+        assert client.query("ping") == "pong"
+
+
+def test_compare(server, lrc_dir, tmp_path_factory):
+    run0, run1 = (os.path.join(lrc_dir, f"run{i}.lrc") for i in range(2))
+    outside = write_lrc_file(
+        tmp_path_factory.mktemp("outside") / "outside.lrc", 10, ("wsfdA", "wsfdB")
+    )
+
+    with LrcClient(server.socket_path) as client:
+        result = client.query("compare", file1=run0, file2=run1)
+        assert result["comparable"]
+        assert client.query("compare", file1=run0, file2=run1) == result
+
+        with pytest.raises(Exception, match="not in the served directory"):
+            client.query("compare", file1=run0, file2=outside)
+
+    # the cached file is loaded only once
+    assert len(server._loaded_files) == 2
+
+
+def test_compare_cache_eviction(lrc_dir, tmp_path):
+    lrc_server = LrcServer(
+        lrc_dir, socket_path=str(tmp_path / "lrc.sock"), compare_cache_size=2
+    )
+    for i in range(4):
+        lrc_server._load_file(os.path.join(lrc_dir, f"run{i}.lrc"))
+
+    assert [os.path.basename(path) for path in lrc_server._loaded_files] == [
+        "run2.lrc",
+        "run3.lrc",
+    ]
+
+
+def test_second_server_refuses_to_start(server, lrc_dir):
+    second = LrcServer(lrc_dir, socket_path=server.socket_path)
+
+    with pytest.raises(Exception, match="already running"):
+        second.serve_forever()
+    with LrcClient(server.socket_path) as client:
+        assert client.query("ping") == "pong"
+
+
+def test_stale_socket_is_replaced(lrc_dir, tmp_path):
+    socket_path = tmp_path / "lrc.sock"
+    socket_path.touch()
+    lrc_server = LrcServer(lrc_dir, socket_path=str(socket_path))
+
+    thread = threading.Thread(target=lrc_server.serve_forever, daemon=True)
+    thread.start()
+    _wait_for(lambda: is_server_running(str(socket_path)))
+    lrc_server.shutdown()
+    thread.join()
+
+    assert not socket_path.exists()
+
+
+def test_cli_output_does_not_depend_on_server(server, lrc_dir, monkeypatch, capsys):
+    pair = [os.path.join(lrc_dir, f"run{i}.lrc") for i in range(2)]
+
+    outputs = []
+    for server_args in (["--server-socket", server.socket_path], ["--no-server"]):
+        for output_format in ("text", "json"):
+            argv = ["compare-data-files", *server_args, "-f", output_format, *pair]
+            monkeypatch.setattr(sys, "argv", argv)
+            assert compare_data_files.main() == 0
+            outputs.append(capsys.readouterr())
+
+    assert outputs[:2] == outputs[2:]
+    assert not any(output.err for output in outputs)
+    # the comparisons were done by the server
+    assert len(server._loaded_files) == 2
+
+
+def test_cli_falls_back_to_local_loading(server, tmp_path_factory, monkeypatch, capsys):
+    outside_dir = tmp_path_factory.mktemp("outside")
+    pair = [
+        write_lrc_file(outside_dir / f"outside{i}.lrc", i, ("wsfdA", "wsfdB"))
+        for i in range(2)
+    ]
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["compare-data-files", "--server-socket", server.socket_path, *pair],
+    )
+
+    assert compare_data_files.main() == 0
+    output = capsys.readouterr()
+    assert "not in the served directory" in output.err
+    assert f"Comparing runs: {pair[0]} vs {pair[1]}" in output.out
@@ -0,0 +1,79 @@
+import math
+import os
+
+import pytest
+
+from conftest import write_lrc_file
+from lrc_file import LrcFile, LrcSet
+
+
+@pytest.fixture
+def data_set(lrc_dir, tmp_path_factory):
+    # 10, 11 and 12 intervals in 3 iterations, and 2 iterations of 5 intervals
+    short_dir = tmp_path_factory.mktemp("short")
+    data_files = [LrcFile(os.path.join(lrc_dir, f"run{i}.lrc")) for i in range(3)]
+    data_files.append(
+        LrcFile(
+            write_lrc_file(
+                short_dir / "short.lrc", 10, ("wsfdA", "wsfdB"), runs=2, intervals=5
+            )
+        )
+    )
+    return LrcSet(data_files, machines=set())
+
+
+def _is_nan(values):
+    return all(math.isnan(value) for value in values)
+
+
+def test_raw_series_padding(data_set):
+    series = data_set.get_raw_series("flow0")
+
+    assert [len(file_data) for file_data in series] == [3, 3, 3, 3]
+    assert {len(data) for file_data in series for data in file_data} == {12}
+
+    expected = data_set.data_files[0].get_raw_flow_data()[1].receiver_series[0].data
+    assert series[0][1][:10] == list(expected)
+    assert _is_nan(series[0][1][10:])
+    # missing iteration of the short file
+    assert _is_nan(series[3][2])
+
+
+def test_raw_series_length(data_set):
+    series = data_set.get_raw_series("cpu", data_type="cpu", length=11, fill_value=0.0)
+
+    assert {len(data) for file_data in series for data in file_data} == {11}
+    assert series[0][0][10] == 0.0
+    assert series[3][2] == [0.0] * 11
+
+    truncated = data_set.get_raw_series("cpu", data_type="cpu", length=3)
+    assert truncated[2][0] == series[2][0][:3]
+
+
+def test_raw_series_windows(data_set):
+    series = data_set.get_raw_series(
+        "flow1(agg)", side="generator", window=5, aggregation="sum"
+    )
+    raw = data_set.data_files[2].get_raw_flow_data()[0].generator_series[1].data
+
+    # 12 intervals make 3 windows, the last one partial
+    assert len(series[2][0]) == 3
+    assert series[2][0] == [math.fsum(raw[i:i + 5]) for i in (0, 5, 10)]
+    # `length` counts windows
+    series = data_set.get_raw_series("flow1(agg)", window=5, length=2)
+    assert {len(data) for file_data in series for data in file_data} == {2}
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"series_label": "flow7"}, "No flow series 'flow7'"),
+        ({"series_label": "flow0", "data_type": "disk"}, "Unknown data type"),
+        ({"series_label": "flow0", "side": "both"}, "Unknown side"),
+        ({"series_label": "flow0", "window": 0}, "positive number"),
+        ({"series_label": "flow0", "aggregation": "median"}, "Unknown aggregation"),
+    ],
+)
+def test_raw_series_errors(data_set, kwargs, message):
+    with pytest.raises(Exception, match=message):
+        data_set.get_raw_series(**kwargs)
@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from lrc_file import LrcDir, LrcSets
+
+
+def _file_count(data_set):
+    return len(data_set.data_files)
+
+
+def _fail_on_wsfdA(data_set):
+    if "wsfdA" in data_set.machines:
+        raise ValueError("wsfdA failed")
+    return len(data_set.data_files)
+
+
+@pytest.fixture
+def data_sets(lrc_dir):
+    return LrcSets(LrcDir(lrc_dir))
+
+
+def test_map_data_sets_order(data_sets):
+    results = data_sets.map_data_sets(_file_count, max_workers=2)
+
+    machines = [frozenset(data_set.machines) for data_set in data_sets.data_sets]
+    assert list(results) == list(dict.fromkeys(machines))
+    assert results == {
+        frozenset({"wsfdA", "wsfdB"}): 3,
+        frozenset({"wsfdC", "wsfdD"}): 3,
+    }
+
+
+def test_map_data_sets_evaluates_machine_sets_once(data_sets):
+    calls = []
+    lock = threading.Lock()
+
+    def func(data_set):
+        with lock:
+            calls.append(frozenset(data_set.machines))
+        return data_set.metrics
+
+    results = data_sets.map_data_sets(func)
+
+    assert len(data_sets.data_sets) == 6
+    assert sorted(calls, key=sorted) == sorted(results, key=sorted)
+
+
+def test_map_data_sets_applies_filters(data_sets):
+    data_sets.data_filters = {"params": {"mtu": 9000}}
+
+    assert set(data_sets.map_data_sets(_file_count).values()) == {0}
+
+
+def test_map_data_sets_reports_all_failures(data_sets):
+    calls = []
+
+    def func(data_set):
+        calls.append(data_set)
+        return _fail_on_wsfdA(data_set)
+
+    with pytest.raises(Exception, match="Evaluation failed") as error:
+        data_sets.map_data_sets(func)
+
+    assert "['wsfdA', 'wsfdB']: ValueError('wsfdA failed')" in str(error.value)
+    assert isinstance(error.value.__cause__, ValueError)
+    # the other data set was still evaluated
+    assert len(calls) == 2
+
+
+def test_map_data_sets_in_processes(data_sets):
+    # relies on workers being forked, so that they have the lnst stand-in
+    assert data_sets.map_data_sets(
+        _file_count, max_workers=2, use_processes=True
+    ) == data_sets.map_data_sets(_file_count)
+
+    with pytest.raises(Exception, match="wsfdA failed"):
+        data_sets.map_data_sets(_fail_on_wsfdA, use_processes=True)
@@ -0,0 +1,74 @@
+from concurrent.futures import ProcessPoolExecutor
+import glob
+import json
+import math
+import multiprocessing
+import os
+
+import pytest
+
+from lrc_file import LrcFile, LrcFileCollection, LrcSets, MetricSummary, merge_summaries
+from lrc_file.LrcSummary import QuantileSketch
+
+
+def _summarize(filenames):
+    collection = LrcFileCollection()
+    for filename in filenames:
+        collection.append_data_file(LrcFile(filename))
+    return {
+        machines: {name: summary.to_dict() for name, summary in summaries.items()}
+        for machines, summaries in LrcSets(collection).metric_summaries().items()
+    }
+
+
+def test_sharded_summaries_merge_to_single_set_summary(lrc_dir):
+    filenames = sorted(glob.glob(os.path.join(lrc_dir, "*.lrc")))
+    shards = [filenames[i::3] for i in range(3)]
+
+    # fork so that the workers inherit the lnst stand-in from conftest
+    with ProcessPoolExecutor(
+        max_workers=3, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        shard_summaries = list(executor.map(_summarize, shards))
+
+    expected = _summarize(filenames)
+    assert expected
+    for machines, summaries in expected.items():
+        merged = merge_summaries(
+            {
+                name: MetricSummary.from_dict(summary)
+                for name, summary in shard[machines].items()
+            }
+            for shard in shard_summaries
+            if machines in shard
+        )
+        assert merged.keys() == summaries.keys()
+        for name, summary in summaries.items():
+            merged_summary = merged[name].to_dict()
+            # sums depend on the order the values were added in
+            for key in ("total", "total_squares"):
+                assert merged_summary.pop(key) == pytest.approx(summary.pop(key))
+            assert merged_summary == summary
+
+
+def test_non_finite_values_are_skipped():
+    summary = MetricSummary.from_values([1.0, math.nan, 3.0, math.inf, -math.inf])
+
+    assert summary.count == 2
+    assert summary.skipped == 3
+    assert summary.mean == 2.0
+    assert summary.maximum == 3.0
+    assert summary.merge(summary).skipped == 6
+    assert MetricSummary.from_dict(summary.to_dict()) == summary
+
+    with pytest.raises(Exception):
+        QuantileSketch().add(math.nan)
+
+
+def test_empty_summary_is_json_serializable():
+    summary = MetricSummary.from_values([math.nan])
+    data = json.loads(json.dumps(summary.to_dict(), allow_nan=False))
+
+    assert data["minimum"] is None and data["maximum"] is None
+    assert MetricSummary.from_dict(data) == summary
+    assert MetricSummary.from_dict(data).merge(MetricSummary.from_values([1.0])).minimum == 1.0
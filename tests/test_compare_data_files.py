@@ -0,0 +1,86 @@
+import json
+import os
+import sys
+
+import pytest
+
+from conftest import write_lrc_file
+from lrc_file.scripts import compare_data_files
+
+
+def _run(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["compare-data-files", "--no-server", *args])
+    exit_code = compare_data_files.main()
+    return exit_code, capsys.readouterr()
+
+
+def test_text_pairs(lrc_dir, monkeypatch, capsys):
+    run0, run1, run2 = (os.path.join(lrc_dir, f"run{i}.lrc") for i in range(3))
+
+    exit_code, output = _run(monkeypatch, capsys, run0, run1, run0, run2)
+
+    assert exit_code == 0
+    assert f"Comparing runs: {run0} vs {run1}" in output.out
+    assert f"Comparing runs: {run0} vs {run2}" in output.out
+    assert output.out.count("Measurement comparison:") == 2
+
+
+def test_text_not_comparable_continues(lrc_dir, tmp_path, monkeypatch, capsys):
+    candidate = write_lrc_file(
+        tmp_path / "candidate.lrc", 10, ("wsfdA", "wsfdB"), mtu=9000
+    )
+
+    exit_code, output = _run(monkeypatch, capsys, "-b", lrc_dir, candidate)
+
+    assert exit_code == 1
+    assert output.out.count("Comparing runs:") == 6
+    assert output.out.count("Runs not comparable, errors:") == 6
+    assert "Param mtu values different in runs: 1500 != 9000" in output.out
+
+
+def test_candidate_in_baseline_dir(lrc_dir, monkeypatch, capsys):
+    candidate = os.path.join(lrc_dir, "run0.lrc")
+
+    exit_code, output = _run(monkeypatch, capsys, "-f", "json", "-b", lrc_dir, candidate)
+
+    results = json.loads(output.out)
+    assert exit_code == 0
+    assert len(results) == 5
+    assert all(result["run2"] == candidate for result in results)
+    assert candidate not in {result["run1"] for result in results}
+
+
+def test_ndjson_exit_code(lrc_dir, tmp_path, monkeypatch, capsys):
+    run0 = os.path.join(lrc_dir, "run0.lrc")
+    candidate = write_lrc_file(
+        tmp_path / "candidate.lrc", 10, ("wsfdA", "wsfdB"), mtu=9000
+    )
+
+    exit_code, output = _run(
+        monkeypatch, capsys, "-f", "ndjson", run0, run0, run0, candidate
+    )
+
+    results = [json.loads(line) for line in output.out.splitlines()]
+    assert exit_code == 1
+    assert [result["comparable"] for result in results] == [True, False]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["file1.lrc"],
+        ["-b", "missing-dir", "file1.lrc"],
+        ["-b", "{empty_dir}", "file1.lrc"],
+        ["-b", "{lrc_dir}"],
+        ["-b", "{lrc_dir}", "missing.lrc"],
+    ],
+)
+def test_invalid_arguments(args, lrc_dir, tmp_path, monkeypatch, capsys):
+    empty_dir = tmp_path / "empty"
+    empty_dir.mkdir()
+    args = [arg.format(lrc_dir=lrc_dir, empty_dir=empty_dir) for arg in args]
+
+    exit_code, output = _run(monkeypatch, capsys, *args)
+
+    assert exit_code == 2
+    assert output.err